@@ -0,0 +1,269 @@
+"""
+SceneScout client: the parts of SceneScout that the CLI and GUI need on every launch,
+namely metadata search and handing videos to the SceneScout daemon, without importing
+torch, Ultralytics or OpenCV. Those are only loaded, from scenescout_daemon, when
+videos have to be processed in-process because no daemon is running.
+"""
+import os
+import re
+import mmap
+import secrets
+import subprocess
+from collections import defaultdict
+from multiprocessing.connection import Client, AuthenticationError
+import orjson
+
+# -----------------------
+# Configuration Variables
+# -----------------------
+# Number of sampled frames sent to the model in a single inference call; also the
+# largest batch the TensorRT engines are built for.
+BATCH_SIZE = 16
+# Average 8x8 grayscale difference (0-255) below which a sampled frame counts as
+# the same scene as the last detected one and is skipped; 0 detects every sampled frame.
+SCENE_THRESHOLD = 0
+# Approximate GPU memory used by one video worker process (model, CUDA context and
+# a batch of frames); limits how many videos are processed in parallel.
+WORKER_GPU_MEMORY_MB = 2048
+# Local address the daemon listens on, and the file holding the secret clients
+# must present to connect.
+DAEMON_ADDRESS = ("127.0.0.1", 50511)
+DAEMON_KEY_PATH = os.path.join(os.path.expanduser("~"), ".scenescout_daemon_key")
+# Inverted search index saved next to the metadata files. The leading dot keeps it
+# apart from the metadata files, which are named after the videos.
+INDEX_FILENAME = ".index.json"
+
+# -----------------------
+# Video Processing Functions
+# -----------------------
+def default_workers():
+    """
+    Returns how many videos to process in parallel: as many worker processes as fit
+    in the free GPU memory reported by nvidia-smi, capped by the CPU count.
+    Falls back to 1 (no worker processes) when nvidia-smi is unavailable.
+    """
+    try:
+        output = subprocess.run(["nvidia-smi", "--query-gpu=memory.free", "--format=csv,noheader,nounits"],
+                                capture_output=True, text=True, check=True).stdout
+        free_mb = int(output.splitlines()[0])
+    except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+        return 1
+    return max(1, min(free_mb // WORKER_GPU_MEMORY_MB, os.cpu_count() or 1))
+
+def process_videos(jobs, frame_skip=30, batch_size=BATCH_SIZE, workers=1, scene_threshold=SCENE_THRESHOLD):
+    """
+    Runs process_video for each (video_path, metadata_path, frames_dir) job and yields
+    (job, detection count) pairs as the videos finish. If a SceneScout daemon is running the
+    videos are sent to it, so its already loaded model is reused; otherwise they are
+    processed here with scenescout_daemon.process_videos_locally, spread over workers
+    worker processes (each loading its own copy of the model) when workers > 1.
+    """
+    conn = connect_daemon()
+    if conn is not None:
+        with conn:
+            for video_path, metadata_path, frames_dir in jobs:
+                conn.send({
+                    "video": os.path.abspath(video_path),
+                    "metadata_path": os.path.abspath(metadata_path),
+                    "frame_skip": frame_skip,
+                    "batch_size": batch_size,
+                    "save_frames_dir": frames_dir and os.path.abspath(frames_dir),
+                    "scene_threshold": scene_threshold
+                })
+                reply = conn.recv()
+                if "error" in reply:
+                    raise RuntimeError(f"SceneScout daemon failed on {video_path}: {reply['error']}")
+                yield (video_path, metadata_path, frames_dir), reply["detections"]
+    else:
+        # Torch, Ultralytics and OpenCV are only imported when videos are processed here.
+        from scenescout_daemon import process_videos_locally
+        yield from process_videos_locally(jobs, frame_skip, batch_size, workers, scene_threshold)
+
+def process_videos_in_directory(video_dir, metadata_dir, frame_skip=30, batch_size=BATCH_SIZE,
+                                save_frames=False, workers=1, scene_threshold=SCENE_THRESHOLD):
+    """
+    Processes all video files in the specified directory.
+      - If save_frames is set, creates a folder for each video to store its extracted frames.
+      - Runs YOLO detection on the frames, on up to workers videos in parallel.
+      - Saves an NDJSON metadata file (one JSON detection per line) with details of detected objects.
+    Returns a log string summarizing the processing.
+    """
+    if not os.path.exists(metadata_dir):
+        os.makedirs(metadata_dir)
+    log = ""
+    # Root folder for all extracted frames (created by process_video when needed).
+    frames_root_dir = os.path.join(metadata_dir, "frames")
+    jobs = []
+    for filename in os.listdir(video_dir):
+        # Hidden files (such as macOS "._" resource forks) are skipped, so no metadata
+        # file can be named like the hidden search index.
+        if filename.lower().endswith((".mp4", ".avi", ".mov", ".mkv")) and not filename.startswith("."):
+            video_path = os.path.join(video_dir, filename)
+            log += f"Processing video: {video_path}\n"
+            # Subfolder for the frames of this video, if they are saved.
+            video_name = os.path.splitext(filename)[0]
+            frames_dir = os.path.join(frames_root_dir, video_name) if save_frames else None
+            metadata_path = os.path.join(metadata_dir, video_name + ".json")
+            jobs.append((video_path, metadata_path, frames_dir))
+    # The metadata files are written by process_video as the videos are processed.
+    results = process_videos(jobs, frame_skip, batch_size, workers, scene_threshold)
+    for (video_path, metadata_path, frames_dir), detection_count in results:
+        log += f"Metadata saved to: {metadata_path} ({detection_count} detections)\n"
+        if frames_dir:
+            log += f"Extracted frames saved to: {frames_dir}\n"
+    build_index(metadata_dir)
+    log += f"Search index saved to: {os.path.join(metadata_dir, INDEX_FILENAME)}\n"
+    return log
+
+# -----------------------
+# Metadata Search Functions
+# -----------------------
+# In-memory copies of loaded search indexes: {index path: (mtime, index)}
+_index_cache = {}
+
+def metadata_files(metadata_dir):
+    """Returns the names of the per-video metadata files in metadata_dir."""
+    return [filename for filename in os.listdir(metadata_dir)
+            if filename.endswith(".json") and not filename.startswith(".")]
+
+def read_metadata(path):
+    """
+    Yields the detections of a metadata file, one line at a time. Files written as a
+    single JSON array by older versions are still read, in one go.
+    """
+    with open(path, "rb") as f:
+        first_line = f.readline()
+        if first_line.lstrip().startswith(b"["):
+            yield from orjson.loads(first_line + f.read())
+            return
+        f.seek(0)
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+def build_index(metadata_dir):
+    """
+    Builds an inverted index over all metadata files in metadata_dir, mapping each
+    lowercase object label to its detections (video name, timestamp, bounding box, and confidence).
+    The index is saved to metadata_dir as INDEX_FILENAME, together with the names of the
+    indexed files, and returned.
+    """
+    index = defaultdict(list)
+    filenames = metadata_files(metadata_dir)
+    for filename in filenames:
+        for detection in read_metadata(os.path.join(metadata_dir, filename)):
+            index[detection["object"].lower()].append({
+                "video": filename.replace(".json", ""),
+                "timestamp": detection["timestamp"],
+                "bbox": detection["bbox"],
+                "confidence": detection["confidence"]
+            })
+    try:
+        with open(os.path.join(metadata_dir, INDEX_FILENAME), "wb") as f:
+            f.write(orjson.dumps({"files": filenames, "labels": index}))
+    except OSError as e:
+        print(f"Error saving search index: {e}")
+    return index
+
+def load_index(metadata_dir):
+    """
+    Returns the inverted index of metadata_dir, or None if it is missing, older than
+    any metadata file, or built from a different set of metadata files (one was added,
+    removed or renamed since). The loaded index is cached in memory between searches.
+    """
+    index_path = os.path.join(metadata_dir, INDEX_FILENAME)
+    if not os.path.exists(index_path):
+        return None
+    index_mtime = os.path.getmtime(index_path)
+    filenames = metadata_files(metadata_dir)
+    if any(os.path.getmtime(os.path.join(metadata_dir, filename)) > index_mtime
+           for filename in filenames):
+        return None
+    cached = _index_cache.get(index_path)
+    if cached and cached[0] == index_mtime:
+        index = cached[1]
+    else:
+        with open(index_path, "rb") as f:
+            index = orjson.loads(f.read())
+        _index_cache[index_path] = (index_mtime, index)
+    if set(index["files"]) != set(filenames):
+        return None
+    return index["labels"]
+
+def scan_metadata(query, metadata_dir):
+    """
+    Searches the metadata files in metadata_dir for object labels containing the
+    lowercase query without parsing them: each file is memory-mapped and scanned for
+    matching "object" fields, and only the detections that match are parsed.
+    """
+    results_found = []
+    # Case-insensitive, as metadata files from older versions may hold mixed-case labels.
+    pattern = re.compile(rb'"object":\s*"[^"]*' + re.escape(query.encode()) + rb'[^"]*"', re.I)
+    for filename in metadata_files(metadata_dir):
+        path = os.path.join(metadata_dir, filename)
+        if os.path.getsize(path) == 0:
+            continue
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in pattern.finditer(mm):
+                start = mm.rfind(b"{", 0, match.start())
+                end = mm.find(b"}", match.end())
+                detection = orjson.loads(mm[start:end + 1])
+                results_found.append({
+                    "video": filename.replace(".json", ""),
+                    "timestamp": detection["timestamp"],
+                    "object": detection["object"].lower(),
+                    "bbox": detection["bbox"],
+                    "confidence": detection["confidence"]
+                })
+    return results_found
+
+def search_metadata(query, metadata_dir):
+    """
+    Searches the metadata in the metadata directory for the specified object, using its inverted index
+    if it is up to date. Otherwise the metadata files are scanned for this query and the
+    index is rebuilt for the next ones.
+    Returns a list of detections with video name, timestamp, object, bounding box, and confidence.
+    """
+    query = query.lower()
+    index = load_index(metadata_dir)
+    if index is None:
+        results_found = scan_metadata(query, metadata_dir)
+        build_index(metadata_dir)
+        return results_found
+    results_found = []
+    for label, detections in index.items():
+        if query in label:
+            for detection in detections:
+                results_found.append({
+                    "video": detection["video"],
+                    "timestamp": detection["timestamp"],
+                    "object": label,
+                    "bbox": detection["bbox"],
+                    "confidence": detection["confidence"]
+                })
+    return results_found
+
+# -----------------------
+# Daemon Connection
+# -----------------------
+def daemon_authkey():
+    """
+    Returns the secret shared by the daemon and its clients, creating it (readable by
+    the current user only) on first use.
+    """
+    if not os.path.exists(DAEMON_KEY_PATH):
+        fd = os.open(DAEMON_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(32))
+    with open(DAEMON_KEY_PATH, "rb") as f:
+        return f.read()
+
+def connect_daemon(address=DAEMON_ADDRESS):
+    """Returns a connection to the running SceneScout daemon, or None if no daemon is running."""
+    # The key is created by the daemon, so without it no daemon has ever been started.
+    if not os.path.exists(DAEMON_KEY_PATH):
+        return None
+    try:
+        return Client(address, authkey=daemon_authkey())
+    except (OSError, AuthenticationError):
+        return None
@@ -0,0 +1,609 @@
+#!/usr/bin/env python3
+"""
+SceneScout daemon: the model loading and video processing behind the SceneScout CLI
+and GUI. Run as a script, it loads the YOLO model once and keeps it resident, so the
+CLI and GUI do not pay for model loading, TensorRT engine deserialization and warm-up
+on every launch. Start it with
+
+    python scenescout_daemon.py
+
+and run the CLI or GUI as usual; they send their videos to the daemon when it is
+running and fall back to processing them in-process when it is not.
+"""
+import os
+import json
+import queue
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from multiprocessing.connection import Listener, AuthenticationError
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import cv2
+import orjson
+import requests
+import numpy as np
+import torch
+from ultralytics import YOLO  # Ensure this matches your YOLO v11 implementation
+try:
+    from ultralytics.utils.nms import non_max_suppression
+except ImportError:  # Ultralytics releases before the nms module
+    from ultralytics.utils.ops import non_max_suppression
+from scenescout_client import BATCH_SIZE, DAEMON_ADDRESS, SCENE_THRESHOLD, daemon_authkey
+
+# -----------------------
+# Configuration Variables
+# -----------------------
+MODEL_FILENAME = "yolo11n.pt"
+# Official YOLO11n model from Ultralytics GitHub release (v8.3.0)
+MODEL_URL = "https://github.com/ultralytics/assets/releases/download/v8.3.0/yolo11n.pt"
+
+# Input resolution the TensorRT engine is built for; every frame is detected at this size.
+IMGSZ = 640
+# Gray used by Ultralytics to pad letterboxed frames up to IMGSZ x IMGSZ.
+LETTERBOX_PAD = 114
+# Number of blank inference runs done when the model is loaded.
+WARMUP_RUNS = 3
+# Number of video frames used to calibrate the INT8 TensorRT engine.
+CALIBRATION_FRAMES = 300
+# JPEG quality of saved frames, and how many frames may wait to be written.
+JPEG_QUALITY = 85
+FRAME_WRITE_QUEUE_SIZE = 64
+# Number of detections held in memory before they are appended to the metadata file.
+METADATA_SPILL_EVERY = 1000
+# The YOLO model of this process, loaded on first use by get_model().
+model = None
+
+def download_model(model_url, model_path):
+    """Download the YOLO model weights from a given URL."""
+    try:
+        print(f"Downloading model from {model_url}...")
+        response = requests.get(model_url, stream=True)
+        response.raise_for_status()
+        with open(model_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+        print("Model download completed.")
+    except Exception as e:
+        print(f"Error downloading model: {e}")
+        raise
+
+def int8_engine_path_for(model_path):
+    """Returns the path of the INT8 TensorRT engine built from model_path."""
+    return os.path.splitext(model_path)[0] + "_int8.engine"
+
+def remove_export_files(model_path):
+    """
+    Deletes the files a TensorRT export from model_path leaves next to it: the
+    intermediate ONNX model and, for INT8 exports, the calibration cache.
+    """
+    for suffix in (".onnx", ".cache"):
+        path = os.path.splitext(model_path)[0] + suffix
+        if os.path.exists(path):
+            os.remove(path)
+
+def prepare_model(model_path):
+    """
+    Downloads the weights if missing and returns the path of the model to load. When
+    CUDA is available a TensorRT engine is used instead of the .pt weights: the INT8
+    engine if one has been built with export_int8_engine, otherwise an FP16 engine
+    that is exported once next to the .pt file. Without CUDA (or if the export fails)
+    the .pt path is returned. Call it once before starting worker processes, so they
+    do not all download and export into the same files at the same time.
+    """
+    if not os.path.exists(model_path):
+        download_model(MODEL_URL, model_path)
+    if not torch.cuda.is_available():
+        return model_path
+    engine_path = int8_engine_path_for(model_path)
+    if not os.path.exists(engine_path):
+        engine_path = os.path.splitext(model_path)[0] + ".engine"
+    if not os.path.exists(engine_path):
+        try:
+            print(f"Exporting TensorRT engine to {engine_path}...")
+            # dynamic=True lets the engine accept any batch up to BATCH_SIZE,
+            # so the last, partial batch of a video still runs on it.
+            engine_path = YOLO(model_path).export(format="engine", half=True, dynamic=True,
+                                                  batch=BATCH_SIZE, imgsz=IMGSZ)
+            remove_export_files(model_path)
+        except Exception as e:
+            print(f"Error exporting TensorRT engine, using {model_path} instead: {e}")
+            engine_path = None
+    return engine_path or model_path
+
+def load_model(model_path):
+    """
+    Load the YOLO model from a path returned by prepare_model (a TensorRT engine or
+    .pt weights). On CUDA machines the model is warmed up before it is returned.
+    """
+    if model_path.endswith(".engine"):
+        model = YOLO(model_path, task="detect")
+    else:
+        model = YOLO(model_path)
+    if torch.cuda.is_available():
+        warmup_model(model)
+    return model
+
+def warmup_model(model, runs=WARMUP_RUNS):
+    """
+    Runs a few inferences on blank frames at the production batch size and resolution,
+    so CUDA/TensorRT initialization and cuDNN kernel selection happen before the first
+    video instead of during it.
+    """
+    # Input shapes stay fixed (IMGSZ, up to BATCH_SIZE frames), so let cuDNN pick the fastest kernels once.
+    torch.backends.cudnn.benchmark = True
+    frames = [np.zeros((IMGSZ, IMGSZ, 3), dtype=np.uint8)] * BATCH_SIZE
+    for _ in range(runs):
+        model(frames, imgsz=IMGSZ, half=True, verbose=False)
+
+def export_int8_engine(model_path, video_dir, num_frames=CALIBRATION_FRAMES):
+    """
+    Builds an INT8 TensorRT engine from model_path, calibrated on up to num_frames
+    frames sampled evenly from the videos in video_dir. The FP16 engine is kept as a
+    fallback. Returns the path of the INT8 engine.
+    """
+    video_paths = [os.path.join(video_dir, filename) for filename in sorted(os.listdir(video_dir))
+                   if filename.lower().endswith((".mp4", ".avi", ".mov", ".mkv"))]
+    if not video_paths:
+        raise ValueError(f"No videos found in {video_dir} to calibrate with")
+    frames_per_video = -(-num_frames // len(video_paths))  # Ceiling division
+
+    with tempfile.TemporaryDirectory() as calib_dir:
+        images_dir = os.path.join(calib_dir, "images")
+        os.makedirs(images_dir)
+        for video_index, video_path in enumerate(video_paths):
+            cap = cv2.VideoCapture(video_path)
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            step = max(total_frames // frames_per_video, 1)
+            for frame_index in range(0, total_frames, step)[:frames_per_video]:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                success, frame = cap.read()
+                if success:
+                    cv2.imwrite(os.path.join(images_dir, f"{video_index:03d}_{frame_index:06d}.jpg"), frame)
+            cap.release()
+
+        # Ultralytics reads calibration images from a dataset YAML; labels are not needed.
+        names = YOLO(model_path).names
+        yaml_path = os.path.join(calib_dir, "calib.yaml")
+        with open(yaml_path, "w") as f:
+            f.write(f"path: {json.dumps(calib_dir)}\ntrain: images\nval: images\nnames:\n")
+            for class_id, name in names.items():
+                f.write(f"  {class_id}: {json.dumps(name)}\n")
+
+        # Export from a renamed copy of the weights so the FP16 engine is not overwritten.
+        int8_engine_path = int8_engine_path_for(model_path)
+        int8_model_path = os.path.splitext(int8_engine_path)[0] + ".pt"
+        shutil.copyfile(model_path, int8_model_path)
+        try:
+            print(f"Exporting INT8 TensorRT engine to {int8_engine_path}...")
+            YOLO(int8_model_path).export(format="engine", int8=True, data=yaml_path, dynamic=True,
+                                         batch=BATCH_SIZE, imgsz=IMGSZ)
+            remove_export_files(int8_model_path)
+        finally:
+            os.remove(int8_model_path)
+    return int8_engine_path
+
+def get_model(model_path=None):
+    """
+    Returns this process's YOLO model, loading it on first use from model_path, a path
+    returned by prepare_model. Without model_path the model is prepared here first.
+    """
+    global model
+    if model is None:
+        # Initialize the YOLOv11 model (TensorRT engine on CUDA machines)
+        model = load_model(model_path or prepare_model(MODEL_FILENAME))
+    return model
+
+# -----------------------
+# Video Processing Functions
+# -----------------------
+def gpu_decode_available():
+    """Returns True if videos can be decoded with NVDEC and handed to the model without leaving the GPU."""
+    return (torch.cuda.is_available()
+            and hasattr(cv2, "cudacodec")
+            and cv2.cuda.getCudaEnabledDeviceCount() > 0
+            and hasattr(cv2.cuda_GpuMat, "__cuda_array_interface__"))
+
+def letterbox_geometry(height, width):
+    """
+    Returns (scale, new_width, new_height, left, top) for letterboxing a height x width
+    frame into IMGSZ x IMGSZ: scaled by its longer side, keeping its aspect ratio, and
+    centred on LETTERBOX_PAD padding.
+    """
+    scale = min(IMGSZ / height, IMGSZ / width)
+    new_width, new_height = round(width * scale), round(height * scale)
+    return scale, new_width, new_height, (IMGSZ - new_width) // 2, (IMGSZ - new_height) // 2
+
+def gpu_frame_to_tensor(gpu_frame):
+    """
+    Wraps a decoded BGR(A) cv2.cuda_GpuMat as a CUDA tensor (no host copy) and converts it
+    to the model input layout: RGB, CHW, float in [0, 1], letterboxed to IMGSZ x IMGSZ.
+    """
+    frame = torch.as_tensor(gpu_frame, device="cuda")
+    _, new_width, new_height, left, top = letterbox_geometry(*frame.shape[:2])
+    rgb = frame[..., [2, 1, 0]].permute(2, 0, 1).unsqueeze(0).float() / 255
+    resized = torch.nn.functional.interpolate(rgb, size=(new_height, new_width), mode="bilinear",
+                                              align_corners=False)[0]
+    padding = (left, IMGSZ - new_width - left, top, IMGSZ - new_height - top)
+    return torch.nn.functional.pad(resized, padding, value=LETTERBOX_PAD / 255)
+
+def upload_frames(frames, pinned):
+    """
+    Letterboxes BGR frames to IMGSZ x IMGSZ directly into the page-locked host buffer
+    pinned and uploads them to the GPU with a single asynchronous copy. Returns the batch
+    in the model input layout: RGB, NCHW, float in [0, 1].
+    """
+    buffer_np = pinned.numpy()
+    for i, frame in enumerate(frames):
+        _, new_width, new_height, left, top = letterbox_geometry(*frame.shape[:2])
+        buffer_np[i].fill(LETTERBOX_PAD)
+        rows = buffer_np[i, top:top + new_height]
+        if new_width == IMGSZ:
+            # Full-width rows are contiguous, so cv2.resize writes into the buffer in place.
+            cv2.resize(frame, (new_width, new_height), dst=rows)
+        else:
+            rows[:, left:left + new_width] = cv2.resize(frame, (new_width, new_height))
+    # The buffer is only refilled for the next batch after the detections of this one
+    # have been copied back to the host, which waits for this upload to finish.
+    batch = pinned[:len(frames)].to("cuda", non_blocking=True)
+    return batch[..., [2, 1, 0]].permute(0, 3, 1, 2).float() / 255
+
+def detect_tensors(model, batch):
+    """
+    Runs the model on a preprocessed (N, 3, IMGSZ, IMGSZ) CUDA batch and returns one
+    (n, 6) CUDA tensor per frame with rows [x1, y1, x2, y2, confidence, class] in batch
+    pixels. model(batch) would build its Results by copying the whole input batch back
+    to the host; here only the detections leave the GPU.
+    """
+    if model.predictor is None:
+        # Normally set up by warmup_model; the first call creates the predictor.
+        model(batch[:1], half=True, verbose=False)
+    predictor = model.predictor
+    batch = batch.half() if predictor.model.fp16 else batch.float()
+    with torch.inference_mode():
+        preds = predictor.model(batch)
+    return non_max_suppression(preds, predictor.args.conf, predictor.args.iou, max_det=predictor.args.max_det)
+
+def detect_batch(model, frames, timestamps, orig_shapes, pinned=None):
+    """
+    Runs YOLO detection on a batch of frames in a single call.
+    Frames are either BGR images or CUDA tensors from gpu_frame_to_tensor; BGR images
+    are uploaded through the pinned host buffer when one is given, and otherwise
+    preprocessed by Ultralytics.
+    Returns one list of detections per frame.
+    """
+    batch_detections = []
+    # Fixed size and precision keep input shapes constant, so no kernel is re-tuned mid-run.
+    half = torch.cuda.is_available()
+    if isinstance(frames[0], torch.Tensor):
+        outputs = detect_tensors(model, torch.stack(frames))
+    elif pinned is not None:
+        outputs = detect_tensors(model, upload_frames(frames, pinned))
+    else:
+        outputs = [result.boxes.data for result in model(frames, imgsz=IMGSZ, half=half, verbose=False)]
+    # Labels are stored lowercase so searches can match them without converting each one.
+    names = {cls: name.lower() for cls, name in model.names.items()}
+    # Ultralytics maps boxes of image inputs back to the source frame itself.
+    letterboxed = isinstance(frames[0], torch.Tensor) or pinned is not None
+    for output, timestamp, (height, width) in zip(outputs, timestamps, orig_shapes):
+        # Copy all detections of the frame to the host at once; each row is
+        # formatted as: [x1, y1, x2, y2, confidence, class]
+        data = output.cpu().numpy()
+        boxes = data[:, :4]
+        if letterboxed:
+            # Undo the letterbox of tensor inputs to get boxes in source frame pixels.
+            scale, _, _, left, top = letterbox_geometry(height, width)
+            boxes = np.clip((boxes - (left, top, left, top)) / scale, 0, (width, height, width, height))
+        bboxes = boxes.tolist()
+        confidences = data[:, 4].tolist()
+        labels = [names[cls] for cls in data[:, 5].astype(int).tolist()]
+        batch_detections.append([{
+            "timestamp": timestamp,
+            "object": label,
+            "bbox": bbox,
+            "confidence": conf
+        } for label, bbox, conf in zip(labels, bboxes, confidences)])
+    return batch_detections
+
+def frame_signature(frame):
+    """Cheap 8x8 grayscale thumbnail of a BGR frame, used to spot near-identical frames."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA).astype(np.int16)
+
+def tensor_signature(tensor, height, width):
+    """
+    GPU counterpart of frame_signature for the tensor gpu_frame_to_tensor made from a
+    height x width frame: the area-averaged 8x8 thumbnail, on a 0-255 scale, of the
+    frame's grayscale (with the cv2.COLOR_BGR2GRAY weights), letterbox padding excluded.
+    """
+    _, new_width, new_height, left, top = letterbox_geometry(height, width)
+    content = tensor[:, top:top + new_height, left:left + new_width]
+    weights = torch.tensor([0.299, 0.587, 0.114], device=tensor.device).view(3, 1, 1)  # RGB order
+    gray = (content * weights).sum(0, keepdim=True)
+    return torch.nn.functional.adaptive_avg_pool2d(gray, 8) * 255
+
+def read_frames(cap, frame_skip, fps, read_q, stop, scene_threshold=SCENE_THRESHOLD):
+    """
+    Reader stage: decodes the video and puts every nth frame on read_q as
+    (frame_count, timestamp, frame, (height, width)). A None sentinel marks the end of the
+    video, or of the frames read before the stop event was set; if reading fails, the
+    exception is put on read_q before it, for process_video to raise.
+    If scene_threshold is set, a sampled frame is dropped when its frame_signature differs from
+    that of the last frame put on read_q by no more than scene_threshold on average.
+    """
+    try:
+        frame_count = 0
+        prev_signature = None
+        # grab() only advances the decoder; the BGR conversion and copy of retrieve()
+        # are paid for the sampled frames alone.
+        while not stop.is_set() and cap.grab():
+            if frame_count % frame_skip == 0:
+                success, frame = cap.retrieve()
+                if success and scene_threshold:
+                    signature = frame_signature(frame)
+                    if prev_signature is not None and np.abs(signature - prev_signature).mean() <= scene_threshold:
+                        success = False  # Same scene as the last detected frame
+                    else:
+                        prev_signature = signature
+                if success:
+                    timestamp = frame_count / fps  # Current timestamp in seconds
+                    read_q.put((frame_count, timestamp, frame, frame.shape[:2]))
+            frame_count += 1
+    except Exception as e:
+        read_q.put(e)
+    finally:
+        cap.release()
+        read_q.put(None)
+
+def read_gpu_frames(reader, frame_skip, fps, read_q, stop, scene_threshold=SCENE_THRESHOLD):
+    """
+    Reader stage for NVDEC decoding: same as read_frames, but every nth frame is
+    converted to a model-ready CUDA tensor with gpu_frame_to_tensor.
+    """
+    try:
+        frame_count = 0
+        prev_signature = None
+        success, gpu_frame = reader.nextFrame()
+        while success and not stop.is_set():
+            if frame_count % frame_skip == 0:
+                tensor = gpu_frame_to_tensor(gpu_frame)
+                width, height = gpu_frame.size()
+                keep = True
+                if scene_threshold:
+                    signature = tensor_signature(tensor, height, width)
+                    if prev_signature is not None and (signature - prev_signature).abs().mean().item() <= scene_threshold:
+                        keep = False  # Same scene as the last detected frame
+                    else:
+                        prev_signature = signature
+                if keep:
+                    timestamp = frame_count / fps  # Current timestamp in seconds
+                    read_q.put((frame_count, timestamp, tensor, (height, width)))
+            frame_count += 1
+            success, gpu_frame = reader.nextFrame()
+    except Exception as e:
+        read_q.put(e)
+    finally:
+        read_q.put(None)
+
+def open_video(video_path, gpu=False):
+    """
+    Opens a video for decoding, on the GPU with NVDEC if gpu is set and supported.
+    Returns (reader function, video source, fps), or None if the video cannot be opened.
+    """
+    if gpu and gpu_decode_available():
+        try:
+            reader = cv2.cudacodec.createVideoReader(video_path)
+            fps = getattr(reader.format(), "fps", 0) or 30  # Default to 30 if FPS is unavailable
+            return read_gpu_frames, reader, fps
+        except cv2.error as e:
+            print(f"GPU decoding failed for {video_path}, using CPU decoding instead: {e}")
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return None
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30  # Default to 30 if FPS is unavailable
+    return read_frames, cap, fps
+
+def write_frames(frames_q):
+    """
+    Frame writer stage: JPEG-encodes each (path, frame) taken from frames_q and
+    writes it to disk until a None sentinel arrives. A frame that cannot be written
+    is reported and skipped, so the queue keeps draining and processing never blocks.
+    """
+    while True:
+        item = frames_q.get()
+        if item is None:
+            break
+        frame_filename, frame = item
+        success, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        if success:
+            try:
+                with open(frame_filename, "wb") as f:
+                    f.write(buf)
+            except OSError as e:
+                print(f"Error saving frame {frame_filename}: {e}")
+
+def write_metadata(metadata_path, detections):
+    """Appends detections to the metadata file metadata_path as NDJSON, one detection per line."""
+    with open(metadata_path, "ab") as f:
+        for detection in detections:
+            f.write(orjson.dumps(detection, option=orjson.OPT_SERIALIZE_NUMPY))
+            f.write(b"\n")
+
+def process_video(video_path, model, metadata_path, frame_skip=30, save_frames_dir=None, batch_size=BATCH_SIZE,
+                  prefetch=None, scene_threshold=SCENE_THRESHOLD):
+    """
+    Processes a single video file:
+      - Extracts frames (saving them to save_frames_dir if provided).
+      - Runs YOLO detection on the processed frames, batch_size frames at a time.
+      - Records metadata: timestamp, object label, bounding box, and confidence.
+    Decoding and frame saving run on their own threads so the model does not sit
+    idle while frames are read or written; at most prefetch frames (default:
+    2 * batch_size) are decoded ahead of the model. Frames that are not saved are
+    decoded on the GPU when possible, so they never pass through host memory.
+    Detections are appended to the NDJSON file metadata_path every METADATA_SPILL_EVERY
+    detections, so memory use does not grow with the length of the video.
+    Returns the number of detections. If decoding or detection fails, the partial
+    metadata file is removed and the error is raised.
+    """
+    # The TensorRT engine accepts batches of at most BATCH_SIZE frames.
+    batch_size = max(1, min(batch_size, BATCH_SIZE))
+    # Start from an empty metadata file; detections are appended to it as they are found.
+    open(metadata_path, "wb").close()
+    video_metadata = []
+    detection_count = 0
+    opened = open_video(video_path, gpu=not save_frames_dir)
+    if opened is None:
+        print(f"Error opening video file: {video_path}")
+        return detection_count
+
+    read_fn, source, fps = opened
+    # CPU-decoded frames reach the GPU through one reusable page-locked buffer per video.
+    # Without a GPU, Ultralytics' own rectangular letterbox is cheaper than a square input.
+    pinned = None
+    if read_fn is read_frames and torch.cuda.is_available():
+        pinned = torch.empty((batch_size, IMGSZ, IMGSZ, 3), dtype=torch.uint8, pin_memory=True)
+    read_q = queue.Queue(maxsize=prefetch or 2 * batch_size)
+    stop = threading.Event()
+    reader = threading.Thread(target=read_fn, args=(source, frame_skip, fps, read_q, stop, scene_threshold),
+                              daemon=True)
+    reader.start()
+    # Save frames on a separate thread so JPEG encoding never blocks inference.
+    writer = None
+    if save_frames_dir:
+        os.makedirs(save_frames_dir, exist_ok=True)
+        frames_q = queue.Queue(maxsize=FRAME_WRITE_QUEUE_SIZE)
+        writer = threading.Thread(target=write_frames, args=(frames_q,), daemon=True)
+        writer.start()
+
+    batch = []
+    try:
+        while True:
+            item = read_q.get()
+            if isinstance(item, Exception):
+                raise item  # The reader failed; do not report a cut-short video as complete
+            if item is not None:
+                batch.append(item)
+                if writer:
+                    frame_count, frame = item[0], item[2]
+                    frames_q.put((os.path.join(save_frames_dir, f"frame_{frame_count:06d}.jpg"), frame))
+            # Run detection once enough frames have been collected, or on the
+            # remaining frames of the last, partial batch.
+            if batch and (item is None or len(batch) == batch_size):
+                _, timestamps, frames, orig_shapes = zip(*batch)
+                for detections in detect_batch(model, list(frames), timestamps, orig_shapes, pinned):
+                    video_metadata.extend(detections)
+                batch = []
+            # Spill the detections collected so far, and the rest once the video is done.
+            if video_metadata and (len(video_metadata) >= METADATA_SPILL_EVERY or item is None):
+                write_metadata(metadata_path, video_metadata)
+                detection_count += len(video_metadata)
+                video_metadata = []
+            if item is None:
+                break
+    except Exception:
+        # Leave no cut-short metadata behind to be indexed as if the video were complete.
+        os.remove(metadata_path)
+        raise
+    finally:
+        # Stop the reader (also when detection fails) and drain read_q so it is never left
+        # blocked on a full queue; its video is released when it exits.
+        stop.set()
+        while reader.is_alive():
+            try:
+                read_q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        reader.join()
+        if writer:
+            frames_q.put(None)
+            writer.join()
+    return detection_count
+
+def process_video_worker(model_path, video_path, metadata_path, frame_skip, batch_size, save_frames_dir,
+                         scene_threshold):
+    """
+    Process pool entry point: runs process_video with the model this worker process
+    loads from model_path.
+    """
+    return process_video(video_path, get_model(model_path), metadata_path, frame_skip,
+                         save_frames_dir=save_frames_dir, batch_size=batch_size, scene_threshold=scene_threshold)
+
+def process_videos_locally(jobs, frame_skip=30, batch_size=BATCH_SIZE, workers=1,
+                           scene_threshold=SCENE_THRESHOLD):
+    """
+    In-process counterpart of the daemon for scenescout_client.process_videos: runs
+    process_video for each (video_path, metadata_path, frames_dir) job and yields
+    (job, detection count) pairs as the videos finish, spread over workers worker
+    processes (each loading its own copy of the model) when workers > 1.
+    """
+    if workers > 1 and len(jobs) > 1:
+        # Download the weights and export the engine once, before the workers load them.
+        model_path = prepare_model(MODEL_FILENAME)
+        # Spawn rather than fork, so every worker sets up its own CUDA context.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as executor:
+            futures = {executor.submit(process_video_worker, model_path, video_path, metadata_path, frame_skip,
+                                       batch_size, frames_dir, scene_threshold):
+                       (video_path, metadata_path, frames_dir)
+                       for video_path, metadata_path, frames_dir in jobs}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    else:
+        for video_path, metadata_path, frames_dir in jobs:
+            detection_count = process_video(video_path, get_model(), metadata_path, frame_skip,
+                                            save_frames_dir=frames_dir, batch_size=batch_size,
+                                            scene_threshold=scene_threshold)
+            yield (video_path, metadata_path, frames_dir), detection_count
+
+# -----------------------
+# Daemon
+# -----------------------
+def handle_client(conn, model):
+    """
+    Serves one client connection: processes each requested video with model, writing
+    its metadata file, and sends back {"detections": count}, or {"error": message} if
+    processing failed.
+    """
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        try:
+            detection_count = process_video(request["video"], model, request["metadata_path"],
+                                            request.get("frame_skip", 30),
+                                            save_frames_dir=request.get("save_frames_dir"),
+                                            batch_size=request.get("batch_size", BATCH_SIZE),
+                                            scene_threshold=request.get("scene_threshold", SCENE_THRESHOLD))
+            conn.send({"detections": detection_count})
+        except Exception as e:
+            conn.send({"error": str(e)})
+
+def serve(address=DAEMON_ADDRESS):
+    """
+    Loads the model once and serves video processing requests from the SceneScout
+    CLI and GUI until interrupted. Clients are served one at a time, so the GPU only
+    ever runs one video.
+    """
+    model = get_model()
+    with Listener(address, authkey=daemon_authkey()) as listener:
+        print(f"SceneScout daemon listening on {address[0]}:{address[1]}")
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, OSError, EOFError) as e:
+                # Wrong key, or a client (or port probe) that dropped during the handshake.
+                print(f"Rejected connection: {e!r}")
+                continue
+            with conn:
+                try:
+                    handle_client(conn, model)
+                except OSError as e:
+                    print(f"Lost connection to client: {e}")
+
+if __name__ == "__main__":
+    try:
+        serve()
+    except KeyboardInterrupt:
+        pass